@@ -0,0 +1,44 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import zigpy_zboss.commands as c
+import zigpy_zboss.types as t
+from zigpy_zboss.api import NRF
+
+
+@pytest.fixture
+def api():
+    api = NRF({})
+    api._uart = MagicMock()
+    api._uart.send = AsyncMock()
+    return api
+
+
+def _rx_on_when_idle_rsp(tsn, value):
+    return c.NcpConfig.GetRxOnWhenIdle.Rsp(
+        TSN=tsn,
+        StatusCat=t.StatusCategory.GENERIC,
+        StatusCode=0,
+        RxOnWhenIdle=value,
+    )
+
+
+@pytest.mark.asyncio
+async def test_request_matches_response_tsn(api):
+    """Concurrent requests of one type resolve by TSN, not arrival order."""
+    first = asyncio.create_task(
+        api.request(c.NcpConfig.GetRxOnWhenIdle.Req(TSN=1)))
+    second = asyncio.create_task(
+        api.request(c.NcpConfig.GetRxOnWhenIdle.Req(TSN=2)))
+
+    # Both requests are on the wire before any response arrives
+    while api._uart.send.call_count < 2:
+        await asyncio.sleep(0)
+
+    api.frame_received(_rx_on_when_idle_rsp(2, 0).to_frame())
+    api.frame_received(_rx_on_when_idle_rsp(1, 1).to_frame())
+
+    assert (await first).RxOnWhenIdle == 1
+    assert (await second).RxOnWhenIdle == 0
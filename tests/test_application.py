@@ -0,0 +1,199 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import zigpy.state
+import zigpy.exceptions
+import zigpy.types as t
+import zigpy.zdo.types as zdo_t
+
+import zigpy_zboss.commands as c
+import zigpy_zboss.types as t_nrf
+from zigpy_zboss.api import NRF
+from zigpy_zboss.exceptions import NrfResponseError
+from zigpy_zboss.zigbee.application import ControllerApplication
+
+NCP = c.NcpConfig
+IEEE = t.EUI64.convert("00:11:22:33:44:55:66:77")
+TC_IEEE = t.EUI64.convert("aa:bb:cc:dd:ee:ff:00:11")
+NWK_KEY = t.KeyData(range(16))
+
+
+@pytest.fixture
+def app():
+    return ControllerApplication({"device": {"path": "/dev/null"}})
+
+
+def test_get_sequence_wraparound(app):
+    tsns = [app.get_sequence() for _ in range(2 * 255 + 1)]
+
+    # TSN 255 is reserved by the NCP protocol and is never used
+    assert 255 not in tsns
+    assert tsns[:2] == [1, 2]
+    assert tsns[253:257] == [254, 0, 1, 2]
+    assert tsns[255:] == tsns[:-255]
+
+
+def _network_info_responses(role):
+    """Return the response fields of every load_network_info getter."""
+    return {
+        NCP.GetJoinStatus: {"Joined": 0x01},
+        NCP.GetShortAddr: {"NWKAddr": t.NWK(0x1234)},
+        NCP.GetLocalIEEE: {"MacInterfaceNum": 0, "IEEE": IEEE},
+        NCP.GetZigbeeRole: {"DeviceRole": role},
+        NCP.GetExtendedPANID: {
+            "ExtendedPANID": t.EUI64.convert("01:02:03:04:05:06:07:08")},
+        NCP.GetShortPANID: {"PANID": t.PanId(0xABCD)},
+        NCP.GetCurrentChannel: {"Page": 0, "Channel": 15},
+        NCP.GetNwkKeys: {
+            "NwkKey1": NWK_KEY, "KeyNumber1": 3,
+            "NwkKey2": NWK_KEY, "KeyNumber2": 0,
+            "NwkKey3": NWK_KEY, "KeyNumber3": 0,
+        },
+        NCP.GetRxOnWhenIdle: {"RxOnWhenIdle": 1},
+        NCP.GetEDTimeout: {"Timeout": t_nrf.TimeoutIndex.Minutes_2},
+        NCP.GetMaxChildren: {"ChildrenNbr": 20},
+        NCP.GetAuthenticationStatus: {"Authenticated": 1},
+        NCP.GetParentAddr: {"NWKParentAddr": t.NWK(0xFFFF)},
+        NCP.GetCoordinatorVersion: {"CoordinatorVersion": 2},
+        NCP.GetTrustCenterAddr: {"TCIEEE": TC_IEEE},
+    }
+
+
+def _mock_api(responses):
+    async def request(req):
+        fields = responses[next(
+            cmd for cmd in responses if type(req) is cmd.Req)]
+        return req.Rsp(
+            TSN=req.TSN,
+            StatusCat=t_nrf.StatusCategory.GENERIC,
+            StatusCode=0,
+            **fields,
+        )
+
+    api = MagicMock()
+    api.request = AsyncMock(side_effect=request)
+    return api
+
+
+def _check_network_info(app):
+    node_info = app.state.node_info
+    assert node_info.nwk == 0x1234
+    assert node_info.ieee == IEEE
+
+    network_info = app.state.network_info
+    assert network_info.extended_pan_id == t.EUI64.convert(
+        "08:07:06:05:04:03:02:01")
+    assert network_info.pan_id == 0xABCD
+    assert network_info.nwk_update_id == 0
+    assert network_info.nwk_manager_id == 0x0000
+    assert network_info.channel == 15
+    assert network_info.security_level == 0x05
+    assert network_info.network_key == zigpy.state.Key(
+        key=NWK_KEY, tx_counter=0, rx_counter=0, seq=3, partner_ieee=IEEE)
+    assert network_info.key_table == []
+    assert network_info.children == []
+    assert network_info.nwk_address == {}
+    assert network_info.stack_specific == {
+        "rx_on_when_idle": 1,
+        "end_device_timeout": t_nrf.TimeoutIndex.Minutes_2,
+        "max_children": 20,
+        "joined": 0x01,
+        "authenticated": 1,
+        "parent_nwk": 0xFFFF,
+        "coordinator_version": 2,
+    }
+
+
+@pytest.mark.asyncio
+async def test_load_network_info_coordinator(app):
+    responses = _network_info_responses(t_nrf.DeviceRole.ZC)
+    app._api = _mock_api(responses)
+
+    await app.load_network_info()
+
+    _check_network_info(app)
+    assert app.state.node_info.logical_type == zdo_t.LogicalType.Coordinator
+    assert app.state.network_info.tc_link_key == zigpy.state.Key(
+        key=app.config["network"]["tc_link_key"],
+        tx_counter=0, rx_counter=0, seq=0, partner_ieee=IEEE)
+
+    # The trust center address is only needed for other roles
+    sent = {type(call.args[0]) for call in app._api.request.call_args_list}
+    assert sent == {cmd.Req for cmd in responses} - {
+        NCP.GetTrustCenterAddr.Req}
+
+
+@pytest.mark.asyncio
+async def test_load_network_info_router(app):
+    app._api = _mock_api(_network_info_responses(t_nrf.DeviceRole.ZR))
+
+    await app.load_network_info()
+
+    _check_network_info(app)
+    assert app.state.node_info.logical_type == zdo_t.LogicalType.Router
+    # Stored as a one-element tuple, as it always has been
+    (tc_link_key,) = app.state.network_info.tc_link_key
+    assert tc_link_key == zigpy.state.Key(
+        key=None, tx_counter=0, rx_counter=0, seq=0, partner_ieee=TC_IEEE)
+    assert type(app._api.request.call_args.args[0]) is (
+        NCP.GetTrustCenterAddr.Req)
+
+
+@pytest.mark.asyncio
+async def test_load_network_info_not_joined(app):
+    responses = _network_info_responses(t_nrf.DeviceRole.ZC)
+    responses[NCP.GetJoinStatus] = {"Joined": 0x00}
+    app._api = _mock_api(responses)
+
+    with pytest.raises(zigpy.exceptions.NetworkNotFormed):
+        await app.load_network_info()
+
+    assert app._api.request.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_connect_reuses_probe_connection(app, mocker):
+    connect = mocker.patch.object(NRF, "connect", AsyncMock())
+    request = mocker.patch.object(NRF, "request", AsyncMock())
+    close = mocker.spy(NRF, "close")
+
+    await app.connect()
+
+    # The probed connection is kept, the port is only opened once
+    assert connect.call_count == 1
+    assert type(request.call_args.args[0]) is NCP.GetZigbeeRole.Req
+    assert isinstance(app._api, NRF)
+    assert app._api._app is app
+    assert close.call_count == 0
+
+
+@pytest.mark.asyncio
+async def test_connect_probe_timeout(app, mocker):
+    mocker.patch.object(NRF, "connect", AsyncMock())
+    mocker.patch.object(
+        NRF, "request", AsyncMock(side_effect=asyncio.TimeoutError))
+    close = mocker.spy(NRF, "close")
+
+    assert await ControllerApplication._connect_and_probe(app.config) is None
+    assert close.call_count == 1
+
+    with pytest.raises(NrfResponseError):
+        await app.connect()
+
+    assert close.call_count == 2
+    assert app._api is None
+
+
+@pytest.mark.asyncio
+async def test_connect_probe_error(app, mocker):
+    mocker.patch.object(NRF, "connect", AsyncMock())
+    mocker.patch.object(
+        NRF, "request", AsyncMock(side_effect=RuntimeError("NCP error")))
+    close = mocker.spy(NRF, "close")
+
+    with pytest.raises(RuntimeError, match="NCP error"):
+        await app.connect()
+
+    assert close.call_count == 1
+    assert app._api is None
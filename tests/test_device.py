@@ -0,0 +1,131 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import zigpy.types as t
+import zigpy.zdo.types as zdo_t
+
+import zigpy_zboss.commands as c
+import zigpy_zboss.types as t_nrf
+from zigpy_zboss.zigbee.device import NrfCoordinator, NrfDevice
+
+
+@pytest.fixture
+def device():
+    app = MagicMock()
+    app.get_sequence.return_value = 0x12
+    app._api.request = AsyncMock(
+        return_value=MagicMock(StatusCode=0)
+    )
+
+    return NrfDevice(app, t.EUI64.convert("00:11:22:33:44:55:66:77"), 0x1234)
+
+
+def _sent_request(device):
+    (request,), _ = device._application._api.request.call_args
+    return request
+
+
+@pytest.mark.parametrize(
+    "method, req_cls",
+    [("Bind_req", c.ZDO.BindReq.Req), ("Unbind_req", c.ZDO.UnbindReq.Req)],
+)
+@pytest.mark.asyncio
+async def test_bind_unbind_ieee(device, method, req_cls):
+    dst_address = zdo_t.MultiAddress(
+        addrmode=t.AddrMode.IEEE,
+        ieee=t.EUI64.convert("aa:bb:cc:dd:ee:ff:00:11"),
+        endpoint=1,
+    )
+
+    status, _, _ = await getattr(device.zdo, method)(
+        device.ieee, 1, 0x0006, dst_address
+    )
+
+    assert status == zdo_t.Status.SUCCESS
+    request = _sent_request(device)
+    assert type(request) is req_cls
+    assert request.DstAddrMode == t_nrf.BindAddrMode.IEEE
+    assert request.DstAddr == dst_address.ieee
+    assert request.DstEndpoint == 1
+
+
+@pytest.mark.parametrize(
+    "method, req_cls",
+    [("Bind_req", c.ZDO.BindReq.Req), ("Unbind_req", c.ZDO.UnbindReq.Req)],
+)
+@pytest.mark.asyncio
+async def test_bind_unbind_group(device, method, req_cls):
+    dst_address = zdo_t.MultiAddress(addrmode=t.AddrMode.Group, nwk=0xABCD)
+
+    status, _, _ = await getattr(device.zdo, method)(
+        device.ieee, 1, 0x0006, dst_address
+    )
+
+    assert status == zdo_t.Status.SUCCESS
+    request = _sent_request(device)
+    assert type(request) is req_cls
+    assert request.DstAddrMode == t_nrf.BindAddrMode.Group
+    assert request.DstAddr == t.EUI64([0xCD, 0xAB, 0, 0, 0, 0, 0, 0])
+    assert request.DstEndpoint == 0
+
+
+@pytest.mark.parametrize("method", ["Bind_req", "Unbind_req"])
+@pytest.mark.asyncio
+async def test_bind_unbind_failure(device, method):
+    device._application._api.request.return_value = MagicMock(
+        StatusCode=zdo_t.Status.NOT_SUPPORTED
+    )
+    dst_address = zdo_t.MultiAddress(
+        addrmode=t.AddrMode.IEEE,
+        ieee=t.EUI64.convert("aa:bb:cc:dd:ee:ff:00:11"),
+        endpoint=1,
+    )
+
+    status, addr, cluster = await getattr(device.zdo, method)(
+        device.ieee, 1, 0x0006, dst_address
+    )
+
+    assert status == zdo_t.Status.NOT_SUPPORTED
+    assert addr is dst_address
+    assert cluster == 0x0006
+
+
+@pytest.mark.asyncio
+async def test_unbind_ieee_through_zigpy(device):
+    """zigpy's own unbind flow sends the destination IEEE address."""
+    dst_address = zdo_t.MultiAddress(
+        addrmode=t.AddrMode.IEEE,
+        ieee=t.EUI64.convert("aa:bb:cc:dd:ee:ff:00:11"),
+        endpoint=1,
+    )
+    device._application.get_dst_address.return_value = dst_address
+    cluster = device.add_endpoint(1).add_input_cluster(0x0006)
+
+    status, _, _ = await device.zdo.unbind(cluster)
+
+    assert status == zdo_t.Status.SUCCESS
+    request = _sent_request(device)
+    assert type(request) is c.ZDO.UnbindReq.Req
+    assert request.DstAddrMode == t_nrf.BindAddrMode.IEEE
+    assert request.DstAddr == dst_address.ieee
+    assert dst_address.ieee.serialize() in request.to_frame().serialize()
+
+
+def test_coordinator_model_info(device):
+    coordinator = NrfCoordinator(device._application, device.ieee, 0x0000)
+
+    assert coordinator.manufacturer == "Nordic Semiconductor"
+    assert coordinator.model == "nRF52840"
+
+    with pytest.raises(AttributeError):
+        coordinator.model = "Cached Basic cluster value"
+
+
+@pytest.mark.asyncio
+async def test_permit_joining_float_duration(device):
+    await device.zdo.Mgmt_Permit_Joining_req(60.0, 0)
+
+    request = _sent_request(device)
+    assert type(request) is c.ZDO.PermitJoin.Req
+    assert request.PermitDuration == 60
+    assert request.TCSignificance == 0
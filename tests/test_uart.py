@@ -0,0 +1,50 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+import zigpy_zboss.commands as c
+from zigpy_zboss.exceptions import InvalidFrame
+from zigpy_zboss.frames import Frame
+from zigpy_zboss.uart import Uart
+
+
+@pytest.fixture
+def uart():
+    return Uart(MagicMock(), MagicMock())
+
+
+@pytest.fixture(scope="module")
+def frame_bytes():
+    frame = c.NcpConfig.GetModuleVersion.Req(TSN=10).to_frame()
+    frame.ll_header = frame.ll_header.with_crc8(
+        frame.ll_header.calculate_crc8())
+    return frame.serialize()
+
+
+def test_extract_frame(uart, frame_bytes):
+    uart._buffer += frame_bytes + b"\xAB"
+
+    frame = uart._extract_frame()
+
+    assert frame.serialize() == frame_bytes
+    assert uart._buffer == b"\xAB"
+
+
+def test_extract_frame_bad_crc8(uart, frame_bytes):
+    uart._buffer += frame_bytes[:6] + bytes([frame_bytes[6] ^ 0xFF])
+
+    # A bad LL header is rejected before the rest of the frame arrives
+    with pytest.raises(InvalidFrame):
+        uart._extract_frame()
+
+
+def test_frame_deserialize_crc8(frame_bytes):
+    bad_frame = frame_bytes[:6] + bytes([frame_bytes[6] ^ 0xFF])
+    bad_frame += frame_bytes[7:]
+
+    with pytest.raises(InvalidFrame):
+        Frame.deserialize(bad_frame)
+
+    frame, rest = Frame.deserialize(bad_frame, check_crc8=False)
+    assert frame.hl_packet.serialize() == frame_bytes[7:]
+    assert rest == b""
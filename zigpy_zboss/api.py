@@ -134,7 +134,7 @@ class NRF:
         matched = False
         one_shot_matched = False
 
-        for listener in self._listeners[command.header]:
+        for listener in self._listeners.get(command.header, ()):
             if one_shot_matched and isinstance(
                     listener, OneShotResponseListener):
                 continue
@@ -171,7 +171,10 @@ class NRF:
 
         frame = request.to_frame()
 
-        response_future = self.wait_for_response(request.Rsp(partial=True))
+        # Match the response on its TSN so that concurrent requests of the
+        # same type are each resolved by their own response.
+        response_future = self.wait_for_response(
+            request.Rsp(partial=True, TSN=request.TSN))
 
         if request.blocking:
             async with self._blocking_request_lock:
@@ -13,7 +13,7 @@ class CRC8:
     digest_size = 1
     block_size = 1
 
-    _table = [
+    _table = bytes([
         0xea, 0xd4, 0x96, 0xa8, 0x12, 0x2c, 0x6e, 0x50, 0x7f, 0x41, 0x03, 0x3d,
         0x87, 0xb9, 0xfb, 0xc5, 0xa5, 0x9b, 0xd9, 0xe7, 0x5d, 0x63, 0x21, 0x1f,
         0x30, 0x0e, 0x4c, 0x72, 0xc8, 0xf6, 0xb4, 0x8a, 0x74, 0x4a, 0x08, 0x36,
@@ -35,7 +35,7 @@ class CRC8:
         0xdb, 0xe5, 0xa7, 0x99, 0x23, 0x1d, 0x5f, 0x61, 0x9f, 0xa1, 0xe3, 0xdd,
         0x67, 0x59, 0x1b, 0x25, 0x0a, 0x34, 0x76, 0x48, 0xf2, 0xcc, 0x8e, 0xb0,
         0xd0, 0xee, 0xac, 0x92, 0x28, 0x16, 0x54, 0x6a, 0x45, 0x7b, 0x39, 0x07,
-        0xbd, 0x83, 0xc1, 0xff]
+        0xbd, 0x83, 0xc1, 0xff])
 
     def __init__(self, initial_string=b'', initial_start=0x00):
         """Create a new crc8 hash instance."""
@@ -86,6 +86,10 @@ class LLHeader(t.uint56_t):
         """Set the header crc8."""
         return type(self)(self & 0x00FFFFFFFFFFFF | (value & 0xFF) << 48)
 
+    def calculate_crc8(self) -> t.uint8_t:
+        """Return the CRC8 computed over the size, type and flags fields."""
+        return CRC8(((self >> 16) & 0xFFFFFFFF).to_bytes(4, "little")).digest()
+
     def __str__(self) -> str:
         """Return a string representation."""
         return (
@@ -121,7 +125,9 @@ class HLPacket:
     @property
     def length(self) -> t.uint8_t:
         """Length of the frame (including HL checksum)."""
-        return t.uint8_t(len(self.serialize()))
+        # CRC16 (2 bytes) + common header (4 bytes) + data, there is no need
+        # to serialize and checksum the whole packet to get its length.
+        return t.uint8_t(2 + 4 + len(self.data))
 
     @classmethod
     def deserialize(cls, data):
@@ -136,10 +142,8 @@ class HLPacket:
 
     def serialize(self) -> bytes:
         """Serialize frame and calculate CRC."""
-        hl_checksum = CRC16(
-            self.header.serialize() + self.data.serialize()).digest()
-        return hl_checksum.serialize() + self.header.serialize() + \
-            self.data.serialize()
+        data = self.header.serialize() + self.data.serialize()
+        return CRC16(data).digest().serialize() + data
 
 
 @dataclasses.dataclass
@@ -152,8 +156,14 @@ class Frame:
         default=t.uint16_t(0xADDE), repr=False)
 
     @classmethod
-    def deserialize(cls, data: bytes) -> tuple[Frame, bytes]:
-        """Deserialize frame and sanity check."""
+    def deserialize(
+        cls, data: bytes, check_crc8: bool = True
+    ) -> tuple[Frame, bytes]:
+        """Deserialize frame and sanity check.
+
+        `check_crc8` can be disabled when the caller already verified the LL
+        header checksum.
+        """
         ll_header, data = LLHeader.deserialize(data)
         if ll_header.signature != cls.signature:
             raise InvalidFrame(
@@ -161,12 +171,14 @@ class Frame:
                 f"0x{cls.signature:04X}, got 0x{ll_header.signature:04X}"
             )
 
-        ll_checksum = CRC8(ll_header.serialize()[2:6]).digest()
-        if ll_checksum != ll_header.crc8:
-            raise InvalidFrame(
-                f"Invalid frame checksum for data {ll_header}: "
-                f"expected 0x{ll_header.crc8:02X}, got 0x{ll_checksum:02X}"
-            )
+        if check_crc8:
+            ll_checksum = ll_header.calculate_crc8()
+            if ll_checksum != ll_header.crc8:
+                raise InvalidFrame(
+                    f"Invalid frame checksum for data {ll_header}: "
+                    f"expected 0x{ll_header.crc8:02X}, "
+                    f"got 0x{ll_checksum:02X}"
+                )
         if ll_header.flags & t.LLFlags.isACK:
             return cls(ll_header, None), data
 
@@ -191,8 +203,7 @@ class Frame:
             .with_type(t.TYPE_ZBOSS_NCP_API_HL)
             .with_flags(flag)
         )
-        crc = CRC8(ll_header.serialize()[2:6]).digest()
-        ll_header = ll_header.with_crc8(crc)
+        ll_header = ll_header.with_crc8(ll_header.calculate_crc8())
         return cls(ll_header, None)
 
     def serialize(self) -> bytes:
@@ -7,7 +7,7 @@ import serial  # type: ignore
 import zigpy_zboss.config as conf
 from zigpy_zboss import types as t
 from zigpy_zboss.frames import Frame
-from zigpy_zboss.checksum import CRC8
+from zigpy_zboss.frames import LLHeader
 import serial_asyncio  # type: ignore
 from zigpy_zboss.logger import SERIAL_LOGGER
 from zigpy_zboss.exceptions import InvalidFrame
@@ -17,6 +17,7 @@ ACK_TIMEOUT = 1
 SEND_RETRIES = 2
 STARTUP_TIMEOUT = 5
 RECONNECT_TIMEOUT = 10
+FRAME_SIGNATURE = Frame.signature.serialize()
 
 
 class BufferTooShort(Exception):
@@ -169,8 +170,8 @@ class Uart(asyncio.Protocol):
 
     def _ll_checksum(self, frame):
         """Return frame with new crc8 checksum calculation."""
-        crc = CRC8(frame.ll_header.serialize()[2:6]).digest()
-        frame.ll_header = frame.ll_header.with_crc8(crc)
+        frame.ll_header = frame.ll_header.with_crc8(
+            frame.ll_header.calculate_crc8())
         return frame
 
     def data_received(self, data: bytes) -> None:
@@ -213,8 +214,7 @@ class Uart(asyncio.Protocol):
             except InvalidFrame:
                 # If the buffer contains invalid data,
                 # drop it until we find the signature
-                signature_idx = self._buffer.find(
-                    Frame.signature.serialize(), 1)
+                signature_idx = self._buffer.find(FRAME_SIGNATURE, 1)
 
                 if signature_idx < 0:
                     # If we don't have a signature in the buffer,
@@ -230,22 +230,30 @@ class Uart(asyncio.Protocol):
             raise BufferTooShort()
 
         # The buffer must start with a SoF
-        if self._buffer[0:2] != Frame.signature.serialize():
+        if self._buffer[0:2] != FRAME_SIGNATURE:
             raise InvalidFrame()
 
-        length, _ = t.uint16_t.deserialize(self._buffer[2:4])
+        # Check that the packet type is ZBOSS NCP API HL.
+        if self._buffer[4] != t.TYPE_ZBOSS_NCP_API_HL:
+            raise InvalidFrame()
+
+        # Verify the LL header checksum before trusting its length, otherwise
+        # a garbage SoF with a bogus length stalls the parser until enough
+        # bytes have been received.
+        ll_header, _ = LLHeader.deserialize(self._buffer)
+        if ll_header.calculate_crc8() != ll_header.crc8:
+            raise InvalidFrame()
+
+        length = ll_header.size
 
         # Don't bother deserializing anything if the packet is too short
         if len(self._buffer) < length + 2:
             raise BufferTooShort()
 
-        # Check that the packet type is ZBOSS NCP API HL.
-        if self._buffer[4] != t.TYPE_ZBOSS_NCP_API_HL:
-            raise InvalidFrame()
-
         # At this point we should have a complete frame
         # If not, deserialization will fail and the error will propapate up
-        frame, rest = Frame.deserialize(self._buffer)
+        # The LL header checksum was verified above, skip it.
+        frame, rest = Frame.deserialize(self._buffer, check_crc8=False)
 
         # If we get this far then we have a valid frame. Update the buffer.
         del self._buffer[: len(self._buffer) - len(rest)]
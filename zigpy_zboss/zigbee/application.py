@@ -1,6 +1,7 @@
 """ControllerApplication for ZBOSS NCP protocol based adapters."""
 import asyncio
 import logging
+import itertools
 import zigpy.util
 import zigpy.state
 import zigpy.appdb
@@ -15,7 +16,7 @@ import zigpy_zboss.types as t_nrf
 import zigpy.zdo.types as zdo_t
 import zigpy_zboss.config as conf
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from zigpy_zboss.api import NRF
 from zigpy_zboss import commands as c
 from zigpy.exceptions import DeliveryError
@@ -30,6 +31,28 @@ FORMAT = "%H:%M:%S"
 DEVICE_JOIN_MAX_DELAY = 2
 REQUEST_MAX_RETRIES = 2
 
+# Trust center policies and their key in stack_specific["tc_policy"].
+TC_POLICY_KEYS = (
+    (t_nrf.PolicyType.TC_Link_Keys_Required, "unique_tclk_required"),
+    (t_nrf.PolicyType.IC_Required, "ic_required"),
+    (t_nrf.PolicyType.TC_Rejoin_Enabled, "tc_rejoin_enabled"),
+    (t_nrf.PolicyType.Ignore_TC_Rejoin, "tc_rejoin_ignored"),
+    (t_nrf.PolicyType.APS_Insecure_Join, "aps_insecure_join_enabled"),
+    (
+        t_nrf.PolicyType.Disable_NWK_MGMT_Channel_Update,
+        "mgmt_channel_update_disabled",
+    ),
+)
+
+# Address mode used by the NCP for each zigpy destination address mode.
+# ZBOSS has no broadcast mode, broadcasts are sent group addressed.
+DST_ADDR_MODE_MAP = {
+    t.AddrMode.NWK: t.AddrMode.NWK,
+    t.AddrMode.IEEE: t.AddrMode.IEEE,
+    t.AddrMode.Group: t.AddrMode.Group,
+    t.AddrMode.Broadcast: t.AddrMode.Group,
+}
+
 
 class ControllerApplication(zigpy.application.ControllerApplication):
     """Controller class."""
@@ -43,15 +66,16 @@ class ControllerApplication(zigpy.application.ControllerApplication):
         self._api: NRF | None = None
         self._reset_task = None
         self.version = None
+        # Do not use tsn 255 as specified in NCP protocol.
+        self._tsn_iter = itertools.cycle([*range(1, 255), 0])
 
     async def connect(self):
         """Connect to the zigbee module."""
         assert self._api is None
-        is_responsive = await self.probe(self.config)
-        if not is_responsive:
+        # Reuse the probed connection instead of opening the port twice.
+        nrf = await self._connect_and_probe(self.config)
+        if nrf is None:
             raise NrfResponseError
-        nrf = NRF(self.config)
-        await nrf.connect()
         self._api = nrf
         self._api.set_application(self)
         self._bind_callbacks()
@@ -101,9 +125,7 @@ class ControllerApplication(zigpy.application.ControllerApplication):
 
     def get_sequence(self):
         """Sequence getter overwrite."""
-        # Do not use tsn 255 as specified in NCP protocol.
-        self._send_sequence = (self._send_sequence + 1) % 255
-        return self._send_sequence
+        return next(self._tsn_iter)
 
     def get_default_stack_specific_formation_settings(self):
         """Populate stack specific config dictionary with default values."""
@@ -178,82 +200,36 @@ class ControllerApplication(zigpy.application.ControllerApplication):
             )
         )
 
-        # Write stack-specific parameters.
-        await self._api.request(
-            request=c.NcpConfig.SetRxOnWhenIdle.Req(
-                TSN=self.get_sequence(),
-                RxOnWhenIdle=network_info.stack_specific["rx_on_when_idle"]
-            )
-        )
-
-        await self._api.request(
-            request=c.NcpConfig.SetEDTimeout.Req(
-                TSN=self.get_sequence(),
-                Timeout=network_info.stack_specific["end_device_timeout"]
-            )
-        )
-
-        await self._api.request(
-            request=c.NcpConfig.SetMaxChildren.Req(
-                TSN=self.get_sequence(),
-                ChildrenNbr=network_info.stack_specific[
-                    "max_children"]
-            )
-        )
-
-        await self._api.request(
-            request=c.NcpConfig.SetTCPolicy.Req(
+        # Write stack-specific parameters. These do not depend on each other
+        # nor on the order in which they are applied, so they are issued
+        # together and only the network formation waits for all of them.
+        # SetMaxChildren and SetTCPolicy are blocking commands and are still
+        # sent one at a time, only SetRxOnWhenIdle and SetEDTimeout overlap.
+        stack_specific = network_info.stack_specific
+        tc_policy = stack_specific["tc_policy"]
+        requests = [
+            c.NcpConfig.SetRxOnWhenIdle.Req(
                 TSN=self.get_sequence(),
-                PolicyType=t_nrf.PolicyType.TC_Link_Keys_Required,
-                PolicyValue=network_info.stack_specific[
-                    "tc_policy"]["unique_tclk_required"]
-            )
-        )
-
-        await self._api.request(
-            request=c.NcpConfig.SetTCPolicy.Req(
-                TSN=self.get_sequence(),
-                PolicyType=t_nrf.PolicyType.IC_Required,
-                PolicyValue=network_info.stack_specific[
-                    "tc_policy"]["ic_required"]
-            )
-        )
-
-        await self._api.request(
-            request=c.NcpConfig.SetTCPolicy.Req(
-                TSN=self.get_sequence(),
-                PolicyType=t_nrf.PolicyType.TC_Rejoin_Enabled,
-                PolicyValue=network_info.stack_specific[
-                    "tc_policy"]["tc_rejoin_enabled"]
-            )
-        )
-
-        await self._api.request(
-            request=c.NcpConfig.SetTCPolicy.Req(
+                RxOnWhenIdle=stack_specific["rx_on_when_idle"]
+            ),
+            c.NcpConfig.SetEDTimeout.Req(
                 TSN=self.get_sequence(),
-                PolicyType=t_nrf.PolicyType.Ignore_TC_Rejoin,
-                PolicyValue=network_info.stack_specific[
-                    "tc_policy"]["tc_rejoin_ignored"]
-            )
-        )
-
-        await self._api.request(
-            request=c.NcpConfig.SetTCPolicy.Req(
+                Timeout=stack_specific["end_device_timeout"]
+            ),
+            c.NcpConfig.SetMaxChildren.Req(
                 TSN=self.get_sequence(),
-                PolicyType=t_nrf.PolicyType.APS_Insecure_Join,
-                PolicyValue=network_info.stack_specific[
-                    "tc_policy"]["aps_insecure_join_enabled"]
-            )
-        )
-
-        await self._api.request(
-            request=c.NcpConfig.SetTCPolicy.Req(
+                ChildrenNbr=stack_specific["max_children"]
+            ),
+        ]
+        requests += [
+            c.NcpConfig.SetTCPolicy.Req(
                 TSN=self.get_sequence(),
-                PolicyType=t_nrf.PolicyType.Disable_NWK_MGMT_Channel_Update,
-                PolicyValue=network_info.stack_specific[
-                    "tc_policy"]["mgmt_channel_update_disabled"]
+                PolicyType=policy_type,
+                PolicyValue=tc_policy[key]
             )
-        )
+            for policy_type, key in TC_POLICY_KEYS
+        ]
+        await asyncio.gather(*(self._api.request(req) for req in requests))
 
         await self._form_network(network_info)
 
@@ -275,42 +251,54 @@ class ControllerApplication(zigpy.application.ControllerApplication):
 
     async def load_network_info(self, *, load_devices=False):
         """Populate state.node_info and state.network_info."""
-        res = await self._api.request(
-            c.NcpConfig.GetJoinStatus.Req(TSN=self.get_sequence()))
-        if not res.Joined & 0x01:
-            raise zigpy.exceptions.NetworkNotFormed
+        ncp = c.NcpConfig
 
-        res = await self._api.request(c.NcpConfig.GetShortAddr.Req(
-            TSN=self.get_sequence()
-        ))
-        self.state.node_info.nwk = res.NWKAddr
+        join_status = await self._api.request(
+            ncp.GetJoinStatus.Req(TSN=self.get_sequence()))
+        if not join_status.Joined & 0x01:
+            raise zigpy.exceptions.NetworkNotFormed
 
-        res = await self._api.request(
-            c.NcpConfig.GetLocalIEEE.Req(
-                TSN=self.get_sequence(), MacInterfaceNum=0))
-        self.state.node_info.ieee = res.IEEE
+        # None of these getters depend on each other, issue them together.
+        # Blocking ones (e.g. GetShortAddr) are still sent one at a time.
+        requests = {
+            "short_addr": ncp.GetShortAddr.Req(TSN=self.get_sequence()),
+            "local_ieee": ncp.GetLocalIEEE.Req(
+                TSN=self.get_sequence(), MacInterfaceNum=0),
+            "zigbee_role": ncp.GetZigbeeRole.Req(TSN=self.get_sequence()),
+            "extended_pan_id": ncp.GetExtendedPANID.Req(
+                TSN=self.get_sequence()),
+            "short_pan_id": ncp.GetShortPANID.Req(TSN=self.get_sequence()),
+            "current_channel": ncp.GetCurrentChannel.Req(
+                TSN=self.get_sequence()),
+            "nwk_keys": ncp.GetNwkKeys.Req(TSN=self.get_sequence()),
+            "rx_on_when_idle": ncp.GetRxOnWhenIdle.Req(
+                TSN=self.get_sequence()),
+            "ed_timeout": ncp.GetEDTimeout.Req(TSN=self.get_sequence()),
+            "max_children": ncp.GetMaxChildren.Req(TSN=self.get_sequence()),
+            "authentication_status": ncp.GetAuthenticationStatus.Req(
+                TSN=self.get_sequence()),
+            "parent_addr": ncp.GetParentAddr.Req(TSN=self.get_sequence()),
+            "coordinator_version": ncp.GetCoordinatorVersion.Req(
+                TSN=self.get_sequence()),
+        }
+        res = dict(zip(requests, await asyncio.gather(
+            *(self._api.request(req) for req in requests.values())
+        )))
 
-        res = await self._api.request(
-            c.NcpConfig.GetZigbeeRole.Req(TSN=self.get_sequence()))
-        self.state.node_info.logical_type = res.DeviceRole
+        self.state.node_info.nwk = res["short_addr"].NWKAddr
+        self.state.node_info.ieee = res["local_ieee"].IEEE
+        self.state.node_info.logical_type = res["zigbee_role"].DeviceRole
 
-        res = await self._api.request(
-            c.NcpConfig.GetExtendedPANID.Req(TSN=self.get_sequence()))
         # FIX! Swaping bytes because of module sending IEEE the wrong way.
         self.state.network_info.extended_pan_id = t.EUI64(
-            res.ExtendedPANID.serialize()[::-1])
-
-        res = await self._api.request(
-            c.NcpConfig.GetShortPANID.Req(TSN=self.get_sequence()))
-        self.state.network_info.pan_id = res.PANID
+            res["extended_pan_id"].ExtendedPANID[::-1])
+        self.state.network_info.pan_id = res["short_pan_id"].PANID
 
         self.state.network_info.nwk_update_id = self.config[
             conf.CONF_NWK][conf.CONF_NWK_UPDATE_ID]
         self.state.network_info.nwk_manager_id = 0x0000
 
-        res = await self._api.request(
-            c.NcpConfig.GetCurrentChannel.Req(TSN=self.get_sequence()))
-        self.state.network_info.channel = res.Channel
+        self.state.network_info.channel = res["current_channel"].Channel
 
         # res = await self._api.request(
         #     c.NcpConfig.GetChannelMask.Req(TSN=self.get_sequence()))
@@ -318,13 +306,11 @@ class ControllerApplication(zigpy.application.ControllerApplication):
 
         self.state.network_info.security_level = 0x05
 
-        res = await self._api.request(
-            c.NcpConfig.GetNwkKeys.Req(TSN=self.get_sequence()))
         self.state.network_info.network_key = zigpy.state.Key(
-            key=res.NwkKey1,
+            key=res["nwk_keys"].NwkKey1,
             tx_counter=0,
             rx_counter=0,
-            seq=res.KeyNumber1,
+            seq=res["nwk_keys"].KeyNumber1,
             partner_ieee=self.state.node_info.ieee,
         )
 
@@ -338,15 +324,15 @@ class ControllerApplication(zigpy.application.ControllerApplication):
                 partner_ieee=self.state.node_info.ieee,
             )
         else:
-            res = await self._api.request(
-                c.NcpConfig.GetTrustCenterAddr.Req(TSN=self.get_sequence()))
+            tc_addr = await self._api.request(
+                ncp.GetTrustCenterAddr.Req(TSN=self.get_sequence()))
             self.state.network_info.tc_link_key = (
                 zigpy.state.Key(
                     key=None,
                     tx_counter=0,
                     rx_counter=0,
                     seq=0,
-                    partner_ieee=res.TCIEEE,
+                    partner_ieee=tc_addr.TCIEEE,
                 ),
             )
 
@@ -354,47 +340,16 @@ class ControllerApplication(zigpy.application.ControllerApplication):
         self.state.network_info.children = []
         self.state.network_info.nwk_address = {}
 
-        res = await self._api.request(
-            c.NcpConfig.GetRxOnWhenIdle.Req(TSN=self.get_sequence()))
-        self.state.network_info.stack_specific[
-            "rx_on_when_idle"
-        ] = res.RxOnWhenIdle
-
-        res = await self._api.request(
-            c.NcpConfig.GetEDTimeout.Req(TSN=self.get_sequence()))
-        self.state.network_info.stack_specific[
-            "end_device_timeout"
-        ] = res.Timeout
-
-        res = await self._api.request(
-            c.NcpConfig.GetMaxChildren.Req(TSN=self.get_sequence()))
-        self.state.network_info.stack_specific[
-            "max_children"
-        ] = res.ChildrenNbr
-
-        res = await self._api.request(
-            c.NcpConfig.GetJoinStatus.Req(TSN=self.get_sequence()))
-        self.state.network_info.stack_specific[
-            "joined"
-        ] = res.Joined
-
-        res = await self._api.request(
-            c.NcpConfig.GetAuthenticationStatus.Req(TSN=self.get_sequence()))
-        self.state.network_info.stack_specific[
-            "authenticated"
-        ] = res.Authenticated
-
-        res = await self._api.request(
-            c.NcpConfig.GetParentAddr.Req(TSN=self.get_sequence()))
-        self.state.network_info.stack_specific[
-            "parent_nwk"
-        ] = res.NWKParentAddr
-
-        res = await self._api.request(
-            c.NcpConfig.GetCoordinatorVersion.Req(TSN=self.get_sequence()))
-        self.state.network_info.stack_specific[
-            "coordinator_version"
-        ] = res.CoordinatorVersion
+        stack_specific = self.state.network_info.stack_specific
+        stack_specific["rx_on_when_idle"] = res["rx_on_when_idle"].RxOnWhenIdle
+        stack_specific["end_device_timeout"] = res["ed_timeout"].Timeout
+        stack_specific["max_children"] = res["max_children"].ChildrenNbr
+        stack_specific["joined"] = join_status.Joined
+        stack_specific["authenticated"] = res[
+            "authentication_status"].Authenticated
+        stack_specific["parent_nwk"] = res["parent_addr"].NWKParentAddr
+        stack_specific["coordinator_version"] = res[
+            "coordinator_version"].CoordinatorVersion
 
         if not load_devices:
             return
@@ -436,17 +391,31 @@ class ControllerApplication(zigpy.application.ControllerApplication):
 
         Checks whether the NCP device is responding to request.
         """
+        nrf = await cls._connect_and_probe(device_config)
+        if nrf is None:
+            return False
+        nrf.close()
+        return True
+
+    @classmethod
+    async def _connect_and_probe(cls, device_config: dict) -> Optional[NRF]:
+        """Connect to the NCP and check that it is responding to request.
+
+        Returns the connected NRF instance or None if the NCP did not respond.
+        """
         nrf = NRF(device_config)
         try:
             await nrf.connect()
             async with async_timeout.timeout(PROBE_TIMEOUT):
                 await nrf.request(
                     c.NcpConfig.GetZigbeeRole.Req(TSN=1), timeout=1)
-            return True
         except asyncio.TimeoutError:
-            return False
-        finally:
             nrf.close()
+            return None
+        except BaseException:
+            nrf.close()
+            raise
+        return nrf
 
     # Overwrites zigpy because of custom ZDO layer required for ZBOSS.
     def add_device(self, ieee: t.EUI64, nwk: t.NWK):
@@ -511,16 +480,17 @@ class ControllerApplication(zigpy.application.ControllerApplication):
 
     def on_apsde_indication(self, msg):
         """APSDE-DATA.indication handler."""
-        is_broadcast = bool(msg.FrameFC & t_nrf.APSFrameFC.Broadcast)
-        is_group = bool(msg.FrameFC & t_nrf.APSFrameFC.Group)
-        is_secure = bool(msg.FrameFC & t_nrf.APSFrameFC.Secure)
+        # Command parameters are resolved by CommandBase.__getattribute__,
+        # look up the ones used several times only once.
+        frame_fc = msg.FrameFC
+        payload = msg.Payload
 
-        if is_broadcast:
+        if frame_fc & t_nrf.APSFrameFC.Broadcast:
             dst = t.AddrModeAddress(
                 addr_mode=t.AddrMode.Broadcast,
                 address=t.BroadcastAddress.ALL_ROUTERS_AND_COORDINATOR,
             )
-        elif is_group:
+        elif frame_fc & t_nrf.APSFrameFC.Group:
             dst = t.AddrModeAddress(
                 addr_mode=t.AddrMode.Group,
                 address=msg.GrpAddr
@@ -539,15 +509,13 @@ class ControllerApplication(zigpy.application.ControllerApplication):
             src_ep=msg.SrcEndpoint,
             dst=dst,
             dst_ep=msg.DstEndpoint,
-            tsn=msg.Payload[1],
+            tsn=payload[1],
             profile_id=msg.ProfileId,
             cluster_id=msg.ClusterId,
-            data=t.SerializableBytes(
-                t.List[t.uint8_t](msg.Payload[0:msg.PayloadLength]).serialize()
-            ),
+            data=t.SerializableBytes(bytes(payload[:msg.PayloadLength])),
             tx_options=(
                 t.TransmitOptions.APS_Encryption
-                if is_secure
+                if frame_fc & t_nrf.APSFrameFC.Secure
                 else t.TransmitOptions.NONE
             ),
         )
@@ -589,22 +557,10 @@ class ControllerApplication(zigpy.application.ControllerApplication):
 
         # Prepare ZBOSS types from zigpy types.
         dst_addr = packet.dst.address
-        dst_addr_mode = packet.dst.addr_mode
-        if packet.dst.addr_mode != t.AddrMode.IEEE:
-            dst_addr = t.EUI64(
-                [
-                    packet.dst.address % 0x100,
-                    packet.dst.address >> 8,
-                    0,
-                    0,
-                    0,
-                    0,
-                    0,
-                    0,
-                ]
-            )
-        if packet.dst.addr_mode == t.AddrMode.Broadcast:
-            dst_addr_mode = t.AddrMode.Group
+        dst_addr_mode = DST_ADDR_MODE_MAP[packet.dst.addr_mode]
+        if dst_addr_mode != t.AddrMode.IEEE:
+            dst_addr = t.EUI64(dst_addr.to_bytes(8, "little"))
+        data = packet.data.serialize()
 
         # Don't release the concurrency-limiting semaphore until we are done
         # trying. There is no point in allowing requests to take turns getting
@@ -614,7 +570,7 @@ class ControllerApplication(zigpy.application.ControllerApplication):
                 c.APS.DataReq.Req(
                     TSN=packet.tsn,
                     ParamLength=t.uint8_t(21),  # Fixed value 21
-                    DataLength=t.uint16_t(len(packet.data.serialize())),
+                    DataLength=t.uint16_t(len(data)),
                     DstAddr=dst_addr,
                     ProfileID=packet.profile_id,
                     ClusterId=packet.cluster_id,
@@ -626,6 +582,6 @@ class ControllerApplication(zigpy.application.ControllerApplication):
                     UseAlias=t.Bool.false,
                     AliasSrcAddr=t.NWK(0x0000),
                     AliasSeqNbr=t.uint8_t(0x00),
-                    Payload=t_nrf.Payload(packet.data.serialize()),
+                    Payload=t_nrf.Payload(data),
                 )
             )
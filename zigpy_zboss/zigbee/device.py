@@ -8,16 +8,41 @@ from zigpy_zboss import commands as c
 from zigpy.zdo import types as zdo_t
 from zigpy.zdo import ZDO as ZigpyZDO
 
+_BROADCAST_RX_ON_WHEN_IDLE = t.NWK(t.BroadcastAddress.RX_ON_WHEN_IDLE)
+_NWK_COORDINATOR = t.NWK(0x0000)
+
+
+def _nwk_to_eui64(nwk: int) -> t.EUI64:
+    """Return a NWK or group address zero padded into an EUI64 field."""
+    return t.EUI64(nwk.to_bytes(8, "little"))
+
+
+# ZBOSS addressing mode and destination address builder for bind requests.
+_BIND_DST_ADDRESSING = {
+    t.AddrMode.IEEE: (t_nrf.BindAddrMode.IEEE, lambda addr: addr.ieee),
+    t.AddrMode.Group: (
+        t_nrf.BindAddrMode.Group, lambda addr: _nwk_to_eui64(addr.nwk)),
+}
+
 
 class NrfZDO(ZigpyZDO):
     """The ZDO endpoint of a device."""
 
+    def __init__(self, device):
+        """Initialize instance."""
+        super().__init__(device)
+        self._app = device._application
+
     def handle_mgmt_permit_joining_req(
         self,
         permit_duration: int,
         tc_significance: int,
     ):
         """Handle ZDO permit joining request."""
+        # Nothing to notify, don't bother building the header.
+        if not self._listeners:
+            return
+
         hdr = zdo_t.ZDOHeader(zdo_t.ZDOCmd.Mgmt_Permit_Joining_req, 0)
         dst_addressing = t.Addressing.IEEE
 
@@ -30,47 +55,22 @@ class NrfZDO(ZigpyZDO):
             (permit_duration, tc_significance),
         )
 
-    @zigpy.util.retryable_request
-    async def Bind_req(self, eui64, ep, cluster, dst_address):
-        """Binding request."""
-        if dst_address.addrmode == t.Addressing.AddrMode.IEEE:
-            addr_mode = t_nrf.AddressingMode.Eui64
-            dst_eui64 = dst_address.ieee
-        elif dst_address.addrmode == t.Addressing.AddrMode.NWK:
-            addr_mode = t_nrf.AddressingMode.Nwk
-            dst_eui64 = [
-                dst_address.nwk % 0x100,
-                dst_address.nwk >> 8,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-            ]
-        elif dst_address.addrmode == t.Addressing.AddrMode.Group:
-            addr_mode = t_nrf.AddressingMode.Group
-            dst_eui64 = [
-                dst_address.nwk % 0x100,
-                dst_address.nwk >> 8,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-            ]
-
-        res = await self._device._application._api.request(
-            c.ZDO.BindReq.Req(
-                TSN=self._device._application.get_sequence(),
+    async def _bind_or_unbind(self, req_cls, eui64, ep, cluster, dst_address):
+        """Send a binding or an unbinding request."""
+        addr_mode, dst_builder = _BIND_DST_ADDRESSING[dst_address.addrmode]
+        dst_eui64 = dst_builder(dst_address)
+
+        res = await self._app._api.request(
+            req_cls(
+                TSN=self._app.get_sequence(),
                 TargetNwkAddr=self._device.nwk,
                 SrcIEEE=eui64,
                 SrcEndpoint=ep,
                 ClusterId=cluster,
                 DstAddrMode=addr_mode,
                 DstAddr=dst_eui64,
-                DstEndpoint=dst_address.endpoint,
+                # Group destinations carry no endpoint, ZBOSS wants 0 there.
+                DstEndpoint=dst_address.endpoint or 0,
             )
         )
         if res.StatusCode != 0:
@@ -78,69 +78,41 @@ class NrfZDO(ZigpyZDO):
 
         return (zdo_t.Status.SUCCESS, dst_address, cluster)
 
+    @zigpy.util.retryable_request
+    async def Bind_req(self, eui64, ep, cluster, dst_address):
+        """Binding request."""
+        return await self._bind_or_unbind(
+            c.ZDO.BindReq.Req, eui64, ep, cluster, dst_address)
+
     @zigpy.util.retryable_request
     async def Unbind_req(self, eui64, ep, cluster, dst_address):
         """Unbinding request."""
-        if dst_address.addrmode == t.Addressing.AddrMode.IEEE:
-            addr_mode = t_nrf.AddressingMode.Eui64
-            dst_eui64 = t.Addressing.IEEE
-        elif dst_address.addrmode == t.Addressing.AddrMode.NWK:
-            addr_mode = t_nrf.AddressingMode.Nwk
-            dst_eui64 = [
-                dst_address.nwk % 0x100,
-                dst_address.nwk >> 8,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-            ]
-        elif dst_address.addrmode == t.Addressing.AddrMode.Group:
-            addr_mode = t_nrf.AddressingMode.Group
-            dst_eui64 = [
-                dst_address.nwk % 0x100,
-                dst_address.nwk >> 8,
-                0,
-                0,
-                0,
-                0,
-                0,
-                0,
-            ]
-
-        res = await self._device._application._api.request(
-            c.ZDO.UnbindReq.Req(
-                TSN=self._device._application.get_sequence(),
-                TargetNwkAddr=self._device.nwk,
-                SrcIEEE=eui64,
-                SrcEndpoint=ep,
-                ClusterId=cluster,
-                DstAddrMode=addr_mode,
-                DstAddr=dst_eui64,
-                DstEndpoint=dst_address.endpoint,
-            )
-        )
-        if res.StatusCode != 0:
-            return (res.StatusCode % 0xFF, dst_address, cluster)
+        return await self._bind_or_unbind(
+            c.ZDO.UnbindReq.Req, eui64, ep, cluster, dst_address)
 
-        return (zdo_t.Status.SUCCESS, dst_address, cluster)
+    def request(self, command, *args, use_ieee=False, **kwargs):
+        """Request overwrite for Bind/Unbind requests.
 
-    @zigpy.util.retryable_request
-    def request(self, command, *args, use_ieee=False):
-        """Request overwrite for Bind/Unbind requests."""
+        Only the dispatched request is retried, retry arguments (`tries`,
+        `delay`) are passed on to it.
+        """
         if command == zdo_t.ZDOCmd.Bind_req:
-            return self.Bind_req(*args)
+            return self.Bind_req(*args, **kwargs)
         if command == zdo_t.ZDOCmd.Unbind_req:
-            return self.Unbind_req(*args)
+            return self.Unbind_req(*args, **kwargs)
+        return self._zigpy_request(command, *args, use_ieee=use_ieee, **kwargs)
+
+    @zigpy.util.retryable_request
+    def _zigpy_request(self, command, *args, use_ieee=False):
+        """Send any other ZDO request through zigpy."""
         return super().request(command, *args, use_ieee=use_ieee)
 
     @zigpy.util.retryable_request
     async def Node_Desc_req(self, nwk):
         """Node descriptor request."""
-        res = await self._device._application._api.request(
+        res = await self._app._api.request(
             c.ZDO.NodeDescReq.Req(
-                TSN=self._device._application.get_sequence(),
+                TSN=self._app.get_sequence(),
                 NwkAddr=nwk
             )
         )
@@ -152,9 +124,9 @@ class NrfZDO(ZigpyZDO):
     @zigpy.util.retryable_request
     async def Simple_Desc_req(self, nwk, ep):
         """Request simple descriptor."""
-        res = await self._device._application._api.request(
+        res = await self._app._api.request(
             c.ZDO.SimpleDescriptorReq.Req(
-                TSN=self._device._application.get_sequence(),
+                TSN=self._app.get_sequence(),
                 NwkAddr=nwk,
                 Endpoint=ep
             )
@@ -162,13 +134,16 @@ class NrfZDO(ZigpyZDO):
         if res.StatusCode != 0:
             return (res.StatusCode, None, None)
 
+        # The ZBOSS descriptor also carries the cluster counts, it cannot be
+        # handed to zigpy as is.
+        simple_desc = res.SimpleDesc
         desc = zdo_t.SimpleDescriptor(
-            endpoint=res.SimpleDesc.endpoint,
-            profile=res.SimpleDesc.profile,
-            device_type=res.SimpleDesc.device_type,
-            device_version=res.SimpleDesc.device_version,
-            input_clusters=res.SimpleDesc.input_clusters,
-            output_clusters=res.SimpleDesc.output_clusters,
+            endpoint=simple_desc.endpoint,
+            profile=simple_desc.profile,
+            device_type=simple_desc.device_type,
+            device_version=simple_desc.device_version,
+            input_clusters=simple_desc.input_clusters,
+            output_clusters=simple_desc.output_clusters,
         )
 
         return (zdo_t.Status.SUCCESS, None, desc)
@@ -176,9 +151,9 @@ class NrfZDO(ZigpyZDO):
     @zigpy.util.retryable_request
     async def Active_EP_req(self, nwk):
         """Request active end points."""
-        res = await self._device._application._api.request(
+        res = await self._app._api.request(
             c.ZDO.ActiveEpReq.Req(
-                TSN=self._device._application.get_sequence(),
+                TSN=self._app.get_sequence(),
                 NwkAddr=nwk
             )
         )
@@ -190,9 +165,9 @@ class NrfZDO(ZigpyZDO):
     @zigpy.util.retryable_request
     async def Mgmt_Lqi_req(self, idx):
         """Request Link Quality Index."""
-        res = await self._device._application._api.request(
+        res = await self._app._api.request(
             c.ZDO.MgmtLqi.Req(
-                TSN=self._device._application.get_sequence(),
+                TSN=self._app.get_sequence(),
                 DestNWK=self._device.nwk,
                 Index=idx,
             )
@@ -204,10 +179,10 @@ class NrfZDO(ZigpyZDO):
 
     async def Mgmt_Leave_req(self, ieee, flags):
         """Request device leaving the network."""
-        res = await self._device._application._api.request(
+        res = await self._app._api.request(
             c.ZDO.MgtLeave.Req(
-                TSN=self._device._application.get_sequence(),
-                DestNWK=t.NWK(self._device._application.devices[ieee].nwk),
+                TSN=self._app.get_sequence(),
+                DestNWK=t.NWK(self._app.devices[ieee].nwk),
                 IEEE=t.EUI64(ieee),
                 Flags=t.uint8_t(flags),
             )
@@ -216,10 +191,10 @@ class NrfZDO(ZigpyZDO):
 
     async def Mgmt_Permit_Joining_req(self, duration, tc_significance):
         """Request join permition."""
-        res = await self._device._application._api.request(
+        res = await self._app._api.request(
             c.ZDO.PermitJoin.Req(
-                TSN=self._device._application.get_sequence(),
-                DestNWK=t.NWK(t.BroadcastAddress.RX_ON_WHEN_IDLE),
+                TSN=self._app.get_sequence(),
+                DestNWK=_BROADCAST_RX_ON_WHEN_IDLE,
                 PermitDuration=t.uint8_t(duration),
                 TCSignificance=t.uint8_t(tc_significance),
             )
@@ -228,14 +203,14 @@ class NrfZDO(ZigpyZDO):
 
     async def Mgmt_NWK_Update_req(self, nwkUpdate):
         """Request join permition."""
-        res = await self._device._application._api.request(
+        res = await self._app._api.request(
             c.ZDO.MgmtNwkUpdate.Req(
-                TSN=self._device._application.get_sequence(),
+                TSN=self._app.get_sequence(),
                 ScanChannelMask=nwkUpdate.ScanChannels,
                 ScanDuration=nwkUpdate.ScanDuration,
                 ScanCount=nwkUpdate.ScanCount,
                 MgrAddr=self._device.nwk,
-                DstNWK=t.NWK(0x0000),
+                DstNWK=_NWK_COORDINATOR,
             )
         )
         if res.StatusCode != 0: